@@ -3,18 +3,50 @@
 
 import re
 import argparse
+import functools
 import gzip
+import hashlib
 import itertools
 import logging
 import math
+import multiprocessing
 import os
+import queue
+import shutil
+import string
+import subprocess
 import sys
-import unicodedata
-from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor, as_completed
-from typing import Dict, Iterable, Iterator, List, Optional, Sequence, Set, Tuple
+import threading
+from multiprocessing import shared_memory
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Sequence, Set, Tuple, Union
 
 FileName = prog = os.path.basename(sys.argv[0])
 
+MaskTokens = List[Union[str, int]]
+
+# Candidates per filter batch (see CandidateBatch)
+FILTER_BATCH_SIZE = 4096
+# Target candidates per parallel job (2+ workers)
+JOB_BATCH_SIZE = 4096
+# Max finished job arenas waiting for the writer (bounds memory when output is the bottleneck)
+RESULT_QUEUE_SIZE = 64
+# Bloom dedupe false-positive rate at capacity
+BLOOM_ERROR_RATE = 1e-5
+# Largest filter sized from the expected candidate count (~290 MB at BLOOM_ERROR_RATE)
+BLOOM_MAX_CAPACITY = 100_000_000
+# Bytes of output accumulated before each write to the output file
+WRITE_BUFFER_SIZE = 4 << 20
+# Max seconds to wait for a result before re-checking that worker processes are alive
+WORKER_POLL_INTERVAL = 1.0
+
+
+def _maybe_numpy():
+    try:
+        import numpy  # type: ignore
+        return numpy
+    except Exception:
+        return None
+
 
 def _maybe_tqdm(iterable, enable: bool, total: Optional[int] = None, desc: str = ""):
     if not enable:
@@ -170,6 +202,16 @@ class WordListMaker:
             "--blacklist", help="Path to blacklist file (one password per line) to exclude.")
         p.add_argument("--max-count", type=int, default=None,
                        help="Stop after generating this many lines.")
+        p.add_argument(
+            "--dedupe",
+            default="exact",
+            choices=["exact", "bloom", "none"],
+            help=(
+                "Duplicate suppression: exact (set of all output, memory grows with count), "
+                "bloom (fixed-size filter: bounded memory but slower than exact, rare false drops), "
+                "none (no deduplication). Default: exact."
+            ),
+        )
 
         # Parallelism
         p.add_argument("-t", "--threads", type=int,
@@ -232,51 +274,99 @@ class WordListMaker:
         logging.debug("Masks: %s", masks)
         logging.debug("Leet map: %s", leet_map)
 
-        # Build base combinations (permutations joined by each joiner)
-        base_strings = self._make_base_combinations(
+        # Tokenize masks once; they are baked into the specialized generator
+        compiled_masks = [_compile_mask(m) for m in masks]
+
+        # Base combinations (permutations joined by each joiner), streamed lazily
+        base_strings = self._iter_base_combinations(
             words, joiners, self.args.max_permutation_length)
 
+        # Upper bound on generated candidates (before dedupe and filters), known up front
+        expected = self._count_base_combinations(
+            len(words), len(set(joiners)), self.args.max_permutation_length
+        ) * self._candidates_per_base(
+            cases, compiled_masks, numbers, symbols, years, leet_map, self.args.leet_max_expansions)
+        logging.debug("Expected candidates (upper bound): %d", expected)
+
+        # With --processes and bloom dedupe, workers share one filter instead of the writer;
+        # they insert every generated candidate, so it is sized for generation, not output
+        workers = max(1, int(self.args.threads or 1))
+        shared_bloom = self.args.dedupe == "bloom" and self.args.processes and workers > 1
+        shared_bloom_capacity = self._bloom_capacity(expected) if shared_bloom else None
+
         # Prepare output
         out_fp = self._open_output(self.args.output, self.args.force)
 
-        # Stream generation
-        gen = self._stream_candidates(
+        # Stream generation (batches of candidates packed for filtering/output)
+        gen = self._stream_batches(
             base_strings=base_strings,
             numbers=numbers,
             symbols=symbols,
             years=years,
             cases=cases,
-            masks=masks,
+            masks=compiled_masks,
             leet_map=leet_map,
             leet_max=self.args.leet_max_expansions,
+            shared_bloom_capacity=shared_bloom_capacity,
         )
 
-        # Wrap with progress if requested (unknown total)
-        gen_iter = _maybe_tqdm(gen, self.args.progress, desc="Generating")
+        # Progress bar if requested (unknown total): counts candidates, advanced once per batch
+        pbar = _maybe_tqdm(None, self.args.progress, desc="Generating")
 
         # Write/print loop with filters
         count = 0
         blacklist = self._load_blacklist(self.args.blacklist)
+        dedupe = None if shared_bloom else self._make_dedupe(
+            self.args.dedupe, self.args.max_count, expected)
+        seen_out = dedupe if isinstance(dedupe, set) else None
+        bloom_out = dedupe if isinstance(dedupe, _BloomFilter) else None
+        # Accepted lines are batched into large writes (one gzip/file call per buffer)
+        out_buf = bytearray()
 
         try:
-            for pw in gen_iter:
-                if not self._passes_filters(pw, self.args.min_length, self.args.max_length, self.args.min_entropy):
-                    continue
-                if blacklist and pw in blacklist:
-                    continue
-
-                if out_fp is not None:
-                    out_fp.write((pw + "\n").encode("utf-8"))
-                if self.args.show:
-                    print(pw)
-
-                count += 1
+            for batch in gen:
+                if pbar is not None:
+                    pbar.update(len(batch))
+                written: List[int] = []
+                selected = self._select(
+                    batch, self.args.min_length, self.args.max_length, self.args.min_entropy)
+                if blacklist:
+                    selected = [i for i in selected if batch.candidates[i] not in blacklist]
+                if bloom_out is not None and selected:
+                    # one hashing/bit pass for the whole batch instead of per candidate
+                    new = bloom_out.add_new_many([batch.candidates[i] for i in selected])
+                    selected = [i for i, is_new in zip(selected, new) if is_new]
+                for i in selected:
+                    pw = batch.candidates[i]
+                    if seen_out is not None:
+                        if pw in seen_out:
+                            continue
+                        seen_out.add(pw)
+
+                    written.append(i)
+                    if self.args.show:
+                        print(pw)
+
+                    count += 1
+                    if self.args.max_count and count >= self.args.max_count:
+                        break
+
+                if out_fp is not None and written:
+                    out_buf += batch.lines(written)
+                    if len(out_buf) >= WRITE_BUFFER_SIZE:
+                        # the writer thread takes ownership of the buffer; start a fresh one
+                        out_fp.write(out_buf)
+                        out_buf = bytearray()
                 if self.args.max_count and count >= self.args.max_count:
                     logging.info("Reached max-count=%d; stopping.",
                                  self.args.max_count)
                     break
         finally:
+            if pbar is not None:
+                pbar.close()
             if out_fp is not None:
+                if out_buf:
+                    out_fp.write(out_buf)
                 out_fp.close()
 
         logging.info("Done. Generated %d line(s).", count)
@@ -319,11 +409,15 @@ class WordListMaker:
 
         os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
         if path.endswith(".gz"):
+            pigz = shutil.which("pigz")
+            if pigz:
+                logging.info("Writing gzip (pigz): %s", path)
+                return _BackgroundWriter(_PigzWriter(pigz, path))
             logging.info("Writing gzip: %s", path)
-            return gzip.open(path, "wb")
+            return _BackgroundWriter(gzip.open(path, "wb"))
         else:
             logging.info("Writing: %s", path)
-            return open(path, "wb")
+            return _BackgroundWriter(_RawFileWriter(path))
 
     def _load_blacklist(self, path: Optional[str]) -> Optional[Set[str]]:
         if not path:
@@ -335,10 +429,38 @@ class WordListMaker:
             logging.warning("Could not load blacklist '%s': %s", path, e)
             return None
 
+    @staticmethod
+    def _make_dedupe(mode: str, max_count: Optional[int], expected: int):
+        if mode == "none":
+            return None
+        if mode == "bloom":
+            # whole batches are inserted, so up to one batch past max_count
+            if max_count:
+                expected = min(expected, max_count + FILTER_BATCH_SIZE)
+            capacity = WordListMaker._bloom_capacity(expected)
+            return _BloomFilter(capacity=capacity, error_rate=BLOOM_ERROR_RATE)
+        return set()
+
+    @staticmethod
+    def _bloom_capacity(expected: int) -> int:
+        """Bloom capacity for an expected item count, capped at BLOOM_MAX_CAPACITY (with a warning)."""
+        if expected > BLOOM_MAX_CAPACITY:
+            logging.warning(
+                "Bloom dedupe: up to %d candidates expected but the filter holds %d; past that, "
+                "new candidates may be dropped as duplicates (use --dedupe exact to avoid this).",
+                expected, BLOOM_MAX_CAPACITY)
+        return max(1, min(expected, BLOOM_MAX_CAPACITY))
+
     # -------- Helpers: parsing options --------
     @staticmethod
     def _normalize(s: str) -> str:
-        return unicodedata.normalize("NFKC", s.strip())
+        s = s.strip()
+        if s.isascii():
+            # NFKC leaves ASCII unchanged
+            return s
+        import unicodedata
+
+        return unicodedata.normalize("NFKC", s)
 
     @staticmethod
     def _parse_csv_allow_empty(csv: str) -> List[str]:
@@ -413,84 +535,49 @@ class WordListMaker:
         return mapping
 
     # -------- Base combination building --------
-    def _make_base_combinations(
+    def _iter_base_combinations(
         self, words: List[str], joiners: List[str], max_len: Optional[int]
-    ) -> List[str]:
+    ) -> Iterator[str]:
         r_max = max_len or len(words)
         r_max = max(1, min(r_max, len(words)))
-        bases: List[str] = []
+        # dedupe preserving order
+        seen: Set[str] = set()
         for r in range(1, r_max + 1):
             for perm in itertools.permutations(words, r):
                 for j in joiners:
-                    bases.append(j.join(perm))
-        # dedupe preserving order
-        seen: Set[str] = set()
-        bases = [b for b in bases if not (b in seen or seen.add(b))]
-        logging.info("Base combinations: %d", len(bases))
-        return bases
+                    b = j.join(perm)
+                    if b not in seen:
+                        seen.add(b)
+                        yield b
+        logging.info("Base combinations: %d", len(seen))
 
-    # -------- Case / leet expansions --------
     @staticmethod
-    def _apply_case(s: str, mode: str) -> str:
-        if mode == "lower":
-            return s.lower()
-        if mode == "upper":
-            return s.upper()
-        if mode == "title":
-            return s.title()
-        if mode == "invert":
-            return "".join(ch.lower() if ch.isupper() else ch.upper() for ch in s)
-        return s  # original
-
-    def _expand_cases(self, base: str, cases: Sequence[str]) -> List[str]:
-        out: List[str] = []
-        seen: Set[str] = set()
-        for c in cases:
-            v = self._apply_case(base, c)
-            if v not in seen:
-                seen.add(v)
-                out.append(v)
-        return out
+    def _count_base_combinations(n_words: int, n_joiners: int, max_len: Optional[int]) -> int:
+        """Upper bound on _iter_base_combinations' output (single words ignore the joiner)."""
+        r_max = max(1, min(max_len or n_words, n_words))
+        return n_words + n_joiners * sum(math.perm(n_words, r) for r in range(2, r_max + 1))
 
-    def _expand_leet(self, s: str, leet_map: Dict[str, List[str]], cap: int) -> List[str]:
-        """
-        Expand with leet replacements (per character mapping). We cap total variants to avoid explosion.
-        Strategy: walk the string; for each char c with mapping, branch to alternatives; prune when exceeding cap.
-        """
-        if not leet_map:
-            return [s]
-
-        variants = [s]
-        for i, ch in enumerate(s):
-            lower = ch.lower()
-            if lower in leet_map:
-                new_variants = []
-                repls = leet_map[lower]
-                for variant in variants:
-                    # keep original
-                    new_variants.append(variant)
-                    # replace this occurrence with each alternative
-                    for rep in repls:
-                        nv = variant[:i] + rep + variant[i + 1:]
-                        new_variants.append(nv)
-                # cap
-                if len(new_variants) > cap:
-                    new_variants = new_variants[:cap]
-                variants = new_variants
-            if len(variants) >= cap:
-                break
-        # dedupe
-        seen: Set[str] = set()
-        out: List[str] = []
-        for v in variants:
-            if v not in seen:
-                seen.add(v)
-                out.append(v)
-        return out[:cap]
+    @staticmethod
+    def _candidates_per_base(
+        cases: Sequence[str],
+        masks: Sequence[MaskTokens],
+        numbers: Sequence[str],
+        symbols: Sequence[str],
+        years: Sequence[str],
+        leet_map: Dict[str, List[str]],
+        leet_max: int,
+    ) -> int:
+        """Upper bound on candidates generated per base (all case and leet variants distinct)."""
+        leet = max(1, leet_max) if leet_map else 1
+        return len(cases) * leet * len(masks) * len(numbers) * len(symbols) * len(years)
 
     # -------- Mask application --------
     @staticmethod
+    @functools.lru_cache(maxsize=4096)
     def _to_camel(s: str) -> str:
+        if s.isalnum():
+            # single alnum chunk: nothing to split
+            return s[:1].upper() + s[1:].lower()
         parts = [p for p in re_split_keep_delims(s)]
         # Capitalize alnum chunks only
         out = []
@@ -501,109 +588,166 @@ class WordListMaker:
                 out.append(p)
         return "".join(out)
 
-    def _apply_masks(
-        self,
-        base: str,
-        numbers: Sequence[str],
-        symbols: Sequence[str],
-        years: Sequence[str],
-        masks: Sequence[str],
-    ) -> Iterator[str]:
-        Base = base[:1].upper() + base[1:] if base else base
-        BASE = base.upper()
-        camel = self._to_camel(base)
-
-        for mask in masks:
-            # choose sources for {num}, {sym}, {year}; empty entries included
-            for num in numbers:
-                for sym in symbols:
-                    for year in years:
-                        candidate = (
-                            mask.replace("{base}", base)
-                            .replace("{Base}", Base)
-                            .replace("{BASE}", BASE)
-                            .replace("{camel}", camel)
-                            .replace("{num}", num)
-                            .replace("{sym}", sym)
-                            .replace("{year}", year)
-                        )
-                        yield candidate
-
     # -------- Streaming generation (with optional parallelism) --------
-    def _stream_candidates(
+    def _stream_batches(
         self,
-        base_strings: List[str],
+        base_strings: Iterable[str],
         numbers: Sequence[str],
         symbols: Sequence[str],
         years: Sequence[str],
         cases: Sequence[str],
-        masks: Sequence[str],
+        masks: Sequence[MaskTokens],
         leet_map: Dict[str, List[str]],
         leet_max: int,
-    ) -> Iterator[str]:
+        shared_bloom_capacity: Optional[int] = None,
+    ) -> Iterator["CandidateBatch"]:
         """
-        Stream all candidates. If --threads/processes > 1, bases are split among workers and results yielded.
+        Stream all candidates as CandidateBatch objects. If --threads/processes > 1, bases are split
+        among workers; process workers return their results already packed as a UTF-8 arena.
+        With shared_bloom_capacity (process workers only), workers dedupe through one shared-memory
+        Bloom filter of that capacity.
         """
         workers = max(1, int(self.args.threads or 1))
         if workers == 1:
-            yield from self._generate_for_chunk(
+            gen = self._generate_for_chunk(
                 base_strings, numbers, symbols, years, cases, masks, leet_map, leet_max
             )
+            for chunk in self._iter_chunks(gen, FILTER_BATCH_SIZE):
+                yield CandidateBatch(chunk)
             return
 
-        # chunk base_strings
-        chunks = self._chunk_list(base_strings, workers)
-        Executor = ProcessPoolExecutor if self.args.processes else ThreadPoolExecutor
+        # Many small jobs (~JOB_BATCH_SIZE candidates each) pulled by workers from a shared job
+        # queue, so uneven jobs balance out and batches stream back as soon as each is ready.
+        per_base = self._candidates_per_base(cases, masks, numbers, symbols, years, leet_map, leet_max)
+        bases_per_job = max(1, JOB_BATCH_SIZE // max(1, per_base))
+        chunks = self._iter_chunks(base_strings, bases_per_job)
+        if self.args.processes:
+            Queue, Worker = multiprocessing.Queue, multiprocessing.Process
+        else:
+            Queue, Worker = queue.Queue, threading.Thread
+        # only process results cross a pipe; thread workers hand over their candidate lists
+        pack = bool(self.args.processes)
 
         # Serialize leet_map etc. for processes
-        with Executor(max_workers=workers) as ex:
-            futures = [
-                ex.submit(
-                    generate_chunk_static,
-                    chunk,
-                    numbers,
-                    symbols,
-                    years,
-                    list(cases),
-                    list(masks),
-                    dict(leet_map),
-                    int(leet_max),
-                )
-                for chunk in chunks
-            ]
-            for fut in as_completed(futures):
-                for pw in fut.result():
-                    yield pw
+        job_kwargs = dict(
+            numbers=list(numbers),
+            symbols=list(symbols),
+            years=list(years),
+            cases=list(cases),
+            masks=list(masks),
+            leet_map=dict(leet_map),
+            leet_max=int(leet_max),
+        )
+        shm = None
+        bloom_args = None
+        if shared_bloom_capacity:
+            shm = shared_memory.SharedMemory(
+                create=True, size=_BloomFilter.num_bytes(shared_bloom_capacity, BLOOM_ERROR_RATE))
+            shm.buf[:] = bytes(shm.size)
+            bloom_args = (shm.name, shared_bloom_capacity, BLOOM_ERROR_RATE, multiprocessing.Lock())
+
+        # Bounded: the feeder pulls base chunks lazily, at most ~2 per worker ahead of them
+        job_q = Queue(maxsize=workers * 2)
+        out_q = Queue(maxsize=RESULT_QUEUE_SIZE)
+
+        def feed():
+            for chunk in chunks:
+                job_q.put(chunk)
+            for _ in range(workers):
+                job_q.put(None)
+
+        pool = [
+            Worker(target=_worker_loop, args=(job_q, out_q, job_kwargs, bloom_args, pack), daemon=True)
+            for _ in range(workers)
+        ]
+        try:
+            for w in pool:
+                w.start()
+            threading.Thread(target=feed, daemon=True).start()
+            finished = 0
+            while finished < workers:
+                try:
+                    item = out_q.get(timeout=WORKER_POLL_INTERVAL)
+                except queue.Empty:
+                    item = ()
+                if self.args.processes:
+                    # a killed process never sends its None sentinel (nor its pending results)
+                    for w in pool:
+                        if w.exitcode not in (None, 0):
+                            raise RuntimeError(
+                                "Worker process %d exited unexpectedly (exit code %d)"
+                                % (w.pid, w.exitcode))
+                if item is None:
+                    finished += 1
+                elif isinstance(item, Exception):
+                    raise item
+                elif not item:
+                    continue
+                elif pack:
+                    arena, lengths = item
+                    if arena:
+                        yield CandidateBatch.from_arena(arena, lengths)
+                else:
+                    yield CandidateBatch(item)
+        finally:
+            # Early stop (max-count): processes are terminated; daemon threads are abandoned
+            if self.args.processes:
+                for w in pool:
+                    if w.is_alive():
+                        w.terminate()
+                job_q.cancel_join_thread()
+            if shm is not None:
+                shm.close()
+                shm.unlink()
 
     @staticmethod
-    def _chunk_list(items: List[str], n: int) -> List[List[str]]:
-        k = max(1, n)
-        size = max(1, (len(items) + k - 1) // k)
-        return [items[i: i + size] for i in range(0, len(items), size)]
+    def _iter_chunks(items: Iterable[str], size: int) -> Iterator[List[str]]:
+        it = iter(items)
+        while chunk := list(itertools.islice(it, max(1, size))):
+            yield chunk
 
     def _generate_for_chunk(
         self,
-        bases: List[str],
+        bases: Iterable[str],
         numbers: Sequence[str],
         symbols: Sequence[str],
         years: Sequence[str],
         cases: Sequence[str],
-        masks: Sequence[str],
+        masks: Sequence[MaskTokens],
         leet_map: Dict[str, List[str]],
         leet_max: int,
     ) -> Iterator[str]:
-        seen: Set[str] = set()
-        for base in bases:
-            # Case variants
-            for cased in self._expand_cases(base, cases):
-                # Leet variants (capped)
-                for leet in self._expand_leet(cased, leet_map, cap=max(1, leet_max)):
-                    for candidate in self._apply_masks(leet, numbers, symbols, years, masks):
-                        if candidate not in seen:
-                            seen.add(candidate)
-                            yield candidate
+        # Cases -> leet variants (capped) -> masks, via a generator specialized for these options.
+        # Duplicates are dropped once, in the writer loop.
+        # (returned directly: no extra generator frame per candidate)
+        gen = _make_generator(cases, masks, numbers, symbols, years, leet_map, leet_max)
+        return gen(bases)
 
     # -------- Filters --------
+    def _select(
+        self, batch: "CandidateBatch", min_len: int, max_len: int, min_entropy: float
+    ) -> List[int]:
+        """
+        Indices of batch candidates passing the filters; vectorized over lengths (and entropy)
+        when NumPy is available.
+        """
+        if min_len > max_len:
+            min_len, max_len = max_len, min_len
+        np = _maybe_numpy()
+        if np is not None:
+            lengths = np.asarray(batch.lengths, dtype=np.int64)
+            keep = (lengths >= min_len) & (lengths <= max_len)
+            if min_entropy > 0.0 and keep.any():
+                keep &= np.asarray(_batch_entropy(batch)) >= min_entropy
+            return np.flatnonzero(keep).tolist()
+
+        idx = [i for i, s in enumerate(batch.candidates)
+               if self._passes_filters(s, min_len, max_len, 0.0)]
+        if min_entropy > 0.0 and idx:
+            ents = _batch_entropy(batch)
+            idx = [i for i in idx if ents[i] >= min_entropy]
+        return idx
+
     @staticmethod
     def _passes_filters(s: str, min_len: int, max_len: int, min_entropy: float) -> bool:
         if min_len > max_len:
@@ -632,105 +776,574 @@ def _shannon_entropy(s: str) -> float:
     return ent
 
 
+class _BackgroundWriter:
+    """
+    Writes buffers to a file object from a dedicated thread, so compression (zlib releases the
+    GIL) and disk I/O overlap with generation. Write errors are re-raised on the next write/close.
+    write() takes ownership of the buffer (no copy): callers must not modify it afterwards.
+    """
+
+    def __init__(self, fp, max_pending: int = 4):
+        self.fp = fp
+        self._q: "queue.Queue[Optional[bytearray]]" = queue.Queue(maxsize=max_pending)
+        self._error: Optional[BaseException] = None
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+
+    def _run(self) -> None:
+        while (data := self._q.get()) is not None:
+            if self._error is None:
+                try:
+                    self.fp.write(data)
+                except Exception as e:
+                    self._error = e
+
+    def write(self, data) -> None:
+        if self._error is not None:
+            raise self._error
+        self._q.put(data)
+
+    def close(self) -> None:
+        self._q.put(None)
+        self._thread.join()
+        self.fp.close()
+        if self._error is not None:
+            raise self._error
+
+
+class _RawFileWriter:
+    """
+    Unbuffered output file: each (large) buffer goes straight to os.write on the fd, skipping
+    the extra copy through Python's BufferedWriter.
+    """
+
+    def __init__(self, path: str):
+        flags = os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, "O_BINARY", 0)
+        self.fd = os.open(path, flags, 0o644)
+
+    def write(self, data) -> None:
+        mv = memoryview(data)
+        while mv:
+            mv = mv[os.write(self.fd, mv):]
+
+    def close(self) -> None:
+        os.close(self.fd)
+
+
+class _PigzWriter:
+    """
+    gzip output through a pigz subprocess (parallel deflate) instead of the stdlib compressor.
+    Runs at level 9 like gzip.open; pigz picks its own thread count (one per CPU), independent
+    of the generator's -t workers.
+    """
+
+    def __init__(self, pigz: str, path: str):
+        self._out = open(path, "wb")
+        self._proc = subprocess.Popen(
+            [pigz, "-9", "-c"], stdin=subprocess.PIPE, stdout=self._out)
+
+    def write(self, data) -> None:
+        self._proc.stdin.write(data)
+
+    def close(self) -> None:
+        self._proc.stdin.close()
+        rc = self._proc.wait()
+        self._out.close()
+        if rc != 0:
+            raise OSError("pigz exited with status %d" % rc)
+
+
+class _BloomFilter:
+    """
+    Fixed-size Bloom filter over a byte buffer; k bit positions per item via double hashing.
+    Membership may report false positives (~error_rate at capacity), never false negatives.
+    Hashing is process-independent, so the buffer may be shared memory used by several processes.
+    """
+
+    def __init__(self, capacity: int, error_rate: float = 1e-5, buffer=None):
+        self.num_bits, self.num_hashes = self.sizing(capacity, error_rate)
+        self.bits = buffer if buffer is not None else bytearray(self.num_bytes(capacity, error_rate))
+
+    @staticmethod
+    def sizing(capacity: int, error_rate: float) -> Tuple[int, int]:
+        capacity = max(1, capacity)
+        num_bits = max(8, int(math.ceil(-capacity * math.log(error_rate) / (math.log(2) ** 2))))
+        return num_bits, max(1, int(round(num_bits / capacity * math.log(2))))
+
+    @classmethod
+    def num_bytes(cls, capacity: int, error_rate: float) -> int:
+        return (cls.sizing(capacity, error_rate)[0] + 7) // 8
+
+    def _positions(self, item: str) -> List[int]:
+        h = int.from_bytes(hashlib.blake2b(item.encode("utf-8"), digest_size=8).digest(), "little")
+        h1, h2 = h >> 32, (h & 0xFFFFFFFF) | 1
+        m = self.num_bits
+        return [(h1 + i * h2) % m for i in range(self.num_hashes)]
+
+    def add_new(self, item: str) -> bool:
+        """Set item's bits; True if any was unset (item not seen before)."""
+        bits = self.bits
+        new = False
+        for i in self._positions(item):
+            byte, bit = i >> 3, 1 << (i & 7)
+            if not bits[byte] & bit:
+                bits[byte] |= bit
+                new = True
+        return new
+
+    def add_new_many(self, items: Sequence[str]) -> List[bool]:
+        """
+        add_new over a batch, in order: per item, True if it was not seen before (earlier items
+        of the batch included). With NumPy, hashing is one pass and bits are tested/set per batch.
+        """
+        np = _maybe_numpy()
+        if np is None or not items:
+            return [self.add_new(c) for c in items]
+
+        blake2b = hashlib.blake2b
+        digests = b"".join([blake2b(c.encode("utf-8"), digest_size=8).digest() for c in items])
+        h = np.frombuffer(digests, dtype="<u8")
+        h1, h2 = h >> np.uint64(32), (h & np.uint64(0xFFFFFFFF)) | np.uint64(1)
+        ks = np.arange(self.num_hashes, dtype=np.uint64)
+        pos = (h1[:, None] + ks[None, :] * h2[:, None]) % np.uint64(self.num_bits)
+        byte = (pos >> np.uint64(3)).astype(np.intp)
+        shift = (pos & np.uint64(7)).astype(np.uint8)
+        bits = np.frombuffer(self.bits, dtype=np.uint8)
+
+        # unseen before this batch, then first occurrence of each hash within it
+        unseen = np.flatnonzero(~((bits[byte] >> shift) & 1).all(axis=1))
+        _, first = np.unique(h[unseen], return_index=True)
+        keep = np.zeros(len(items), dtype=bool)
+        keep[unseen[first]] = True
+        # one fancy-indexed OR per bit value: repeated bytes then all write the same result
+        byte, shift = byte[keep].ravel(), shift[keep].ravel()
+        for b in range(8):
+            sel = shift == b
+            bits[byte[sel]] |= np.uint8(1 << b)
+        return keep.tolist()
+
+
+# Per-process filter attached to the shared-memory Bloom buffer (set by the worker on start);
+# the SharedMemory handle is kept so the mapping outlives the initializer. Bit updates are
+# read-modify-writes on shared bytes, so every test-and-set batch runs under _WORKER_BLOOM_LOCK.
+_WORKER_SHM: Optional[shared_memory.SharedMemory] = None
+_WORKER_BLOOM: Optional[_BloomFilter] = None
+_WORKER_BLOOM_LOCK = None
+
+
+def _init_worker_bloom(shm_name: str, capacity: int, error_rate: float, lock) -> None:
+    global _WORKER_BLOOM, _WORKER_SHM, _WORKER_BLOOM_LOCK
+    _WORKER_SHM = shared_memory.SharedMemory(name=shm_name)
+    _WORKER_BLOOM = _BloomFilter(capacity, error_rate, buffer=_WORKER_SHM.buf)
+    _WORKER_BLOOM_LOCK = lock
+
+
+def _invert_case(s: str) -> str:
+    if s.isascii():
+        # same result as the per-char loop for ASCII, done in C
+        return s.swapcase()
+    return _invert_case_unicode(s)
+
+
+@functools.lru_cache(maxsize=4096)
+def _invert_case_unicode(s: str) -> str:
+    return "".join(ch.lower() if ch.isupper() else ch.upper() for ch in s)
+
+
+@functools.lru_cache(maxsize=64)
+def _leet_trigger_re(keys: Tuple[str, ...]) -> Optional["re.Pattern[str]"]:
+    """
+    Character class of the ASCII chars whose lowercase form is a leet key, so mapped
+    positions in ASCII strings are found by one C-level scan. None if there are none.
+    """
+    chars = [chr(c) for c in range(128) if chr(c).lower() in keys]
+    if not chars:
+        return None
+    return re.compile("[" + "".join(re.escape(c) for c in chars) + "]")
+
+
+def _leet_variants(s: str, leet_map: Dict[str, List[str]], cap: int) -> List[str]:
+    """
+    Up to cap leet variants of s (deduped, original first). Mapped positions are taken left to
+    right until their combined variant count reaches cap; a DFS over those positions (earliest
+    position varies slowest) emits variants directly and stops as soon as cap is reached.
+    Positions index the original string, so a multi-char replacement never shifts later ones
+    ("l=|_;o=()" gives "hel|_()" for "hello", not "hel|()o").
+    """
+    if not leet_map:
+        return [s]
+
+    positions: List[Tuple[int, List[str]]] = []
+    total = 1
+    if s.isascii():
+        trigger = _leet_trigger_re(tuple(leet_map))
+        hits = ((m.start(), m.group()) for m in trigger.finditer(s)) if trigger else ()
+    else:
+        hits = enumerate(s)
+    for i, ch in hits:
+        repls = leet_map.get(ch.lower())
+        if repls:
+            positions.append((i, repls))
+            total *= 1 + len(repls)
+            if total >= cap:
+                break
+
+    chars = list(s)
+    seen: Set[str] = set()
+    out: List[str] = []
+    emitted = 0
+
+    def dfs(k: int) -> bool:
+        nonlocal emitted
+        if k == len(positions):
+            emitted += 1
+            v = "".join(chars)
+            if v not in seen:
+                seen.add(v)
+                out.append(v)
+            return emitted >= cap
+        i, repls = positions[k]
+        orig = chars[i]
+        for rep in (orig, *repls):
+            chars[i] = rep
+            if dfs(k + 1):
+                break
+        chars[i] = orig
+        return emitted >= cap
+
+    dfs(0)
+    return out
+
+
+def _entropy_u8_kernel(data, offsets, lengths, counts, out):
+    # Per-row byte histogram + entropy over an ASCII arena; compiled by Numba when available.
+    for r in range(lengths.shape[0]):
+        n = lengths[r]
+        start = offsets[r]
+        counts[:] = 0
+        for j in range(start, start + n):
+            counts[data[j]] += 1
+        ent = 0.0
+        for c in range(counts.shape[0]):
+            if counts[c]:
+                p = counts[c] / n
+                ent -= p * math.log2(p)
+        out[r] = ent
+
+
+@functools.lru_cache(maxsize=None)
+def _maybe_numba_entropy():
+    try:
+        from numba import njit  # type: ignore
+        return njit(cache=True)(_entropy_u8_kernel)
+    except Exception:
+        return None
+
+
+class CandidateBatch:
+    """
+    A batch of candidates with their newline-terminated output lines packed back to back in
+    one contiguous UTF-8 arena, plus per-candidate character lengths. Byte offsets into the
+    arena are computed on first use (partial lines() selections and the entropy kernels).
+    The candidate strs are kept alongside the arena, so this saves encode and write calls,
+    not memory.
+    """
+
+    __slots__ = ("candidates", "arena", "lengths", "is_ascii", "_offsets")
+
+    def __init__(self, candidates: List[str], arena: Optional[bytes] = None):
+        self.candidates = candidates
+        if arena is None:
+            arena = ("\n".join(candidates) + "\n").encode("utf-8") if candidates else b""
+        self.arena = arena
+        self.lengths = list(map(len, candidates))
+        self.is_ascii = len(arena) == sum(self.lengths) + len(candidates)
+        self._offsets: Optional[List[int]] = None
+
+    @property
+    def offsets(self) -> List[int]:
+        """Byte offset of each line in the arena, plus the arena length."""
+        if self._offsets is None:
+            byte_lengths = self.lengths if self.is_ascii else [
+                len(c.encode("utf-8")) for c in self.candidates]
+            np = _maybe_numpy()
+            if np is not None:
+                ends = np.cumsum(np.asarray(byte_lengths, dtype=np.int64) + 1)
+                self._offsets = [0] + ends.tolist()
+            else:
+                self._offsets = list(itertools.accumulate((n + 1 for n in byte_lengths), initial=0))
+        return self._offsets
+
+    @classmethod
+    def from_arena(cls, arena: bytes, lengths: Optional[List[int]] = None) -> "CandidateBatch":
+        """
+        Rebuild a batch from a worker's arena. Without lengths every candidate is one output line;
+        otherwise lengths (in characters) locate candidates that themselves contain newlines.
+        """
+        text = arena.decode("utf-8")
+        if lengths is None:
+            return cls(text.split("\n")[:-1], arena)
+        candidates = []
+        pos = 0
+        for n in lengths:
+            candidates.append(text[pos: pos + n])
+            pos += n + 1
+        return cls(candidates, arena)
+
+    def __len__(self) -> int:
+        return len(self.candidates)
+
+    def lines(self, indices: Sequence[int]) -> bytes:
+        """
+        Encoded lines (with newlines) of the given ascending indices, copied from the arena as
+        contiguous runs; the whole arena when every candidate is selected.
+        """
+        if len(indices) == len(self.candidates):
+            return self.arena
+        offsets = self.offsets
+        mv = memoryview(self.arena)
+        runs = []
+        start = prev = indices[0]
+        for i in indices[1:]:
+            if i != prev + 1:
+                runs.append(mv[offsets[start]: offsets[prev + 1]])
+                start = i
+            prev = i
+        runs.append(mv[offsets[start]: offsets[prev + 1]])
+        return b"".join(runs)
+
+
+def _batch_entropy(batch: CandidateBatch) -> Sequence[float]:
+    """
+    Shannon entropy for each candidate in batch. ASCII batches run over the arena through a
+    Numba kernel or, failing that, one NumPy histogram pass; otherwise falls back to
+    _shannon_entropy per string.
+    """
+    np = _maybe_numpy()
+    if np is None or not len(batch) or not batch.is_ascii:
+        return [_shannon_entropy(s) for s in batch.candidates]
+
+    n = len(batch)
+    lengths = np.asarray(batch.lengths, dtype=np.int64)
+    offsets = np.asarray(batch.offsets[:-1], dtype=np.int64)
+    data = np.frombuffer(batch.arena, dtype=np.uint8)
+
+    kernel = _maybe_numba_entropy()
+    if kernel is not None:
+        out = np.empty(n, dtype=np.float64)
+        kernel(data, offsets, lengths, np.zeros(128, dtype=np.int64), out)
+        return out
+
+    # histogram every arena byte by row, then drop the newline separators
+    rows = np.repeat(np.arange(n), lengths + 1)
+    keep = np.ones(data.shape[0], dtype=bool)
+    keep[offsets + lengths] = False
+    hist = np.bincount(rows[keep] * 128 + data[keep], minlength=n * 128).reshape(n, 128)
+    probs = hist / np.maximum(lengths, 1)[:, None]
+    logs = np.log2(probs, out=np.zeros_like(probs), where=probs > 0)
+    return -(probs * logs).sum(axis=1)
+
+
+def _worker_loop(job_q, out_q, job_kwargs: dict, bloom_args: Optional[tuple], pack: bool) -> None:
+    """
+    Worker body: pull base chunks until the None sentinel, push each chunk's candidates, then None.
+    With pack (process workers) candidates are pushed as one (arena, lengths) pair per chunk, so
+    a single bytes object is pickled; thread workers push the candidate list as is.
+    Errors are pushed to out_q and re-raised by the parent.
+    """
+    try:
+        if bloom_args is not None:
+            _init_worker_bloom(*bloom_args)
+        while (chunk := job_q.get()) is not None:
+            candidates = generate_chunk_static(chunk, **job_kwargs)
+            out_q.put(_pack_arena(candidates) if pack else candidates)
+    except Exception as e:
+        out_q.put(e)
+    else:
+        out_q.put(None)
+
+
 def generate_chunk_static(
     bases: List[str],
     numbers: Sequence[str],
     symbols: Sequence[str],
     years: Sequence[str],
     cases: Sequence[str],
-    masks: Sequence[str],
+    masks: Sequence[MaskTokens],
     leet_map: Dict[str, List[str]],
     leet_max: int,
 ) -> List[str]:
-    w = WordListMaker  # type alias for methods
-    # Minimal reimplementation of needed instance methods (static-friendly)
-
-    def apply_case(s: str, mode: str) -> str:
-        if mode == "lower":
-            return s.lower()
-        if mode == "upper":
-            return s.upper()
-        if mode == "title":
-            return s.title()
-        if mode == "invert":
-            return "".join(ch.lower() if ch.isupper() else ch.upper() for ch in s)
-        return s
-
-    def expand_cases(base: str, cs: Sequence[str]) -> List[str]:
-        out: List[str] = []
-        seen: Set[str] = set()
-        for c in cs:
-            v = apply_case(base, c)
-            if v not in seen:
-                seen.add(v)
-                out.append(v)
-        return out
+    gen = _make_generator(cases, masks, numbers, symbols, years, leet_map, leet_max)
+    out_all = list(gen(bases))
+    if _WORKER_BLOOM is not None:
+        # shared across workers: drop anything any worker already produced; one locked
+        # test-and-set pass per job, so concurrent updates never lose bits
+        with _WORKER_BLOOM_LOCK:
+            new = _WORKER_BLOOM.add_new_many(out_all)
+        out_all = [c for c, is_new in zip(out_all, new) if is_new]
+    return out_all
 
-    def expand_leet(s: str, leet_map_: Dict[str, List[str]], cap: int) -> List[str]:
-        if not leet_map_:
-            return [s]
-        variants = [s]
-        for i, ch in enumerate(s):
-            lower = ch.lower()
-            if lower in leet_map_:
-                new_variants = []
-                repls = leet_map_[lower]
-                for variant in variants:
-                    new_variants.append(variant)
-                    for rep in repls:
-                        nv = variant[:i] + rep + variant[i + 1:]
-                        new_variants.append(nv)
-                if len(new_variants) > cap:
-                    new_variants = new_variants[:cap]
-                variants = new_variants
-            if len(variants) >= cap:
-                break
-        seen: Set[str] = set()
-        out: List[str] = []
-        for v in variants:
-            if v not in seen:
-                seen.add(v)
-                out.append(v)
-        return out[:cap]
 
-    def to_camel(s: str) -> str:
-        parts = [p for p in re_split_keep_delims(s)]
-        out = []
-        for p in parts:
-            if p.isalnum():
-                out.append(p[:1].upper() + p[1:].lower())
-            else:
-                out.append(p)
-        return "".join(out)
+def _pack_arena(candidates: List[str]) -> Tuple[bytes, Optional[List[int]]]:
+    """
+    Candidates as one contiguous UTF-8 arena (see CandidateBatch.from_arena), plus their lengths
+    only when some candidate spans several lines.
+    """
+    if not candidates:
+        return b"", None
+    arena = ("\n".join(candidates) + "\n").encode("utf-8")
+    multiline = arena.count(b"\n") != len(candidates)
+    return arena, [len(c) for c in candidates] if multiline else None
 
-    def apply_masks(base: str) -> Iterator[str]:
-        Base = base[:1].upper() + base[1:] if base else base
-        BASE = base.upper()
-        camel = to_camel(base)
-        for mask in masks:
-            for num in numbers:
-                for sym in symbols:
-                    for year in years:
-                        yield (
-                            mask.replace("{base}", base)
-                            .replace("{Base}", Base)
-                            .replace("{BASE}", BASE)
-                            .replace("{camel}", camel)
-                            .replace("{num}", num)
-                            .replace("{sym}", sym)
-                            .replace("{year}", year)
-                        )
-
-    seen_all: Set[str] = set()
-    out_all: List[str] = []
-    for base in bases:
-        for cased in expand_cases(base, cases):
-            for leet in expand_leet(cased, leet_map, cap=max(1, leet_max)):
-                for cand in apply_masks(leet):
-                    if cand not in seen_all:
-                        seen_all.add(cand)
-                        out_all.append(cand)
-    return out_all
+
+# -------- Mask compilation --------
+# Placeholder order defines the slot ids used by compiled masks.
+_MASK_SLOTS = ("base", "Base", "BASE", "camel", "num", "sym", "year")
+_BASE_SLOTS = 4  # {base} {Base} {BASE} {camel}; the rest become str.format fields
+_MASK_RE = re.compile(r"\{(base|Base|BASE|camel|num|sym|year)\}")
+
+
+def _escape_format(s: str) -> str:
+    return s.replace("{", "{{").replace("}", "}}")
+
+
+def _compile_mask(mask: str) -> MaskTokens:
+    """
+    Tokenize a mask in one regex pass into base slot ids and str.format-escaped literal chunks,
+    with {num}/{sym}/{year} turned into positional fields {0}/{1}/{2}:
+    "{base}-{num}{sym}" -> [0, "-{0}{1}"].
+    """
+    tokens: MaskTokens = []
+    literal: List[str] = []
+    for i, part in enumerate(_MASK_RE.split(mask)):
+        if not i % 2:
+            literal.append(_escape_format(part))
+            continue
+        slot = _MASK_SLOTS.index(part)
+        if slot >= _BASE_SLOTS:
+            literal.append("{%d}" % (slot - _BASE_SLOTS))
+            continue
+        if any(literal):
+            tokens.append("".join(literal))
+        literal = []
+        tokens.append(slot)
+    if any(literal):
+        tokens.append("".join(literal))
+    return tokens
+
+
+# -------- Generator specialization --------
+# Once options are parsed, cases/masks/numbers/symbols/years are fixed for the whole run, so the
+# cases -> leet -> masks pipeline is emitted as Python source with them baked in (masks become
+# f-strings, value lists become constant tuples) and compiled once.
+_SLOT_NAMES = ("b", "B", "U", "C", "n", "s", "y")
+_CASE_EXPRS = {
+    "original": "base",
+    "lower": "base.lower()",
+    "upper": "base.upper()",
+    "title": "base.title()",
+    "invert": "invert_case(base)",
+}
+_FORMATTER = string.Formatter()
+
+
+def _fstring_literal(text: str) -> str:
+    esc = text.encode("unicode_escape").decode("ascii")
+    return esc.replace('"', '\\"').replace("{", "{{").replace("}", "}}")
+
+
+def _mask_fstring(tokens: MaskTokens) -> str:
+    """
+    Source of an f-string for a compiled mask over the slot names b/B/U/C/n/s/y.
+    """
+    parts: List[str] = []
+    for t in tokens:
+        if not isinstance(t, str):
+            parts.append("{%s}" % _SLOT_NAMES[t])
+            continue
+        for text, field, _, _ in _FORMATTER.parse(t):
+            parts.append(_fstring_literal(text))
+            if field is not None:
+                parts.append("{%s}" % _SLOT_NAMES[_BASE_SLOTS + int(field)])
+    return 'f"' + "".join(parts) + '"'
+
+
+def _generator_source(
+    cases: Sequence[str],
+    masks: Sequence[MaskTokens],
+    numbers: Sequence[str],
+    symbols: Sequence[str],
+    years: Sequence[str],
+    with_leet: bool,
+) -> str:
+    used = {t for tokens in masks for t in tokens if not isinstance(t, str)}
+    lines = ["def gen(bases):", "    for base in bases:"]
+    if len(cases) == 1:
+        lines.append("        for cased in (%s,):" % _CASE_EXPRS[cases[0]])
+    else:
+        # dict.fromkeys dedupes the case variants in order in one C call (e.g. digit-only bases)
+        lines.append("        for cased in dict.fromkeys((%s)):" % ", ".join(_CASE_EXPRS[c] for c in cases))
+    lines.append("            for b in %s:" % ("leet(cased)" if with_leet else "(cased,)"))
+    if 1 in used:
+        lines.append("                B = b[:1].upper() + b[1:]")
+    if 2 in used:
+        lines.append("                U = b.upper()")
+    if 3 in used:
+        lines.append("                C = to_camel(b)")
+    for tokens in masks:
+        # every mask loops over all num/sym/year (empty entries included), like the plain nesting
+        lines += [
+            "                for n in %r:" % (tuple(numbers),),
+            "                    for s in %r:" % (tuple(symbols),),
+            "                        for y in %r:" % (tuple(years),),
+            "                            yield %s" % _mask_fstring(tokens),
+        ]
+    return "\n".join(lines) + "\n"
+
+
+@functools.lru_cache(maxsize=8)
+def _compile_generator(
+    cases: Tuple[str, ...],
+    masks: Tuple[Tuple[Union[str, int], ...], ...],
+    numbers: Tuple[str, ...],
+    symbols: Tuple[str, ...],
+    years: Tuple[str, ...],
+    leet_items: Tuple[Tuple[str, Tuple[str, ...]], ...],
+    leet_max: int,
+) -> Callable[[Iterable[str]], Iterator[str]]:
+    src = _generator_source(cases, masks, numbers, symbols, years, with_leet=bool(leet_items))
+    logging.debug("Specialized generator:\n%s", src)
+    leet_map = {k: list(v) for k, v in leet_items}
+    ns = {
+        "invert_case": _invert_case,
+        "to_camel": WordListMaker._to_camel,
+        "leet": functools.partial(_leet_variants, leet_map=leet_map, cap=max(1, leet_max)),
+    }
+    exec(compile(src, "<generator>", "exec"), ns)
+    return ns["gen"]
+
+
+def _make_generator(
+    cases: Sequence[str],
+    masks: Sequence[MaskTokens],
+    numbers: Sequence[str],
+    symbols: Sequence[str],
+    years: Sequence[str],
+    leet_map: Dict[str, List[str]],
+    leet_max: int,
+) -> Callable[[Iterable[str]], Iterator[str]]:
+    """
+    Generator function (bases -> candidates) specialized for these options; cached per option set.
+    """
+    return _compile_generator(
+        tuple(cases),
+        tuple(tuple(t) for t in masks),
+        tuple(numbers),
+        tuple(symbols),
+        tuple(years),
+        tuple((k, tuple(v)) for k, v in leet_map.items()),
+        int(leet_max),
+    )
 
 
 # -------- Small regex utility used by camel-case conversion --------
@@ -741,7 +1354,7 @@ def re_split_keep_delims(s: str) -> List[str]:
     """
     Split string into alnum and non-alnum chunks, keeping delimiters.
     """
-    if not s:
+    if not s or s.isalnum():
         return [s]
     parts = _SPLIT_DELIMS.split(s)
     return [p for p in parts if p is not None and p != ""]
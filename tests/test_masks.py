@@ -0,0 +1,87 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Regression check for mask handling: masks are compiled and baked into exec'd generator source
+through hand-written escaping, so generated output is compared with a plain str.replace
+reference (the pre-specialization behaviour) over masks full of escaping hazards.
+
+Run: python -m unittest discover -s tests
+"""
+
+import os
+import sys
+import unittest
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from passwords import WordListMaker, _compile_mask, _make_generator  # noqa: E402
+
+MASKS = [
+    "{base}{num}{sym}",
+    "{",
+    "}",
+    "{{",
+    "}}",
+    "{{base}}",
+    "{base}{{}}{num}",
+    "{0}{base}{1}",
+    "{foo}{base}{bar}",
+    "{ base }{base}{}",
+    "%{base}%s%%{num}%d",
+    "'{base}\"{sym}'''\"\"\"",
+    "\\{base}\\n\\\\{num}\\",
+    "{base}\n{num}\r\t",
+    "\x00{base}\x7f",
+    "naïve-{Base}-ß-{BASE}-€",
+    "日本{camel}語{year}",
+    "{camel}{Base}{BASE}{base}{num}{sym}{year}",
+    "{num}{sym}{year}",
+    "literal only",
+    "",
+]
+BASES = ["hello", "wörld", "o'b\"x\\y", "a{b}c", "%s%%", "{0}", "éclair_pie", ""]
+NUMBERS = ["", "1", "%d", "{}"]
+SYMBOLS = ["!", '"', "'", "\\", "%", "}"]
+YEARS = ["", "2025"]
+
+
+def reference(base: str, mask: str) -> list:
+    # Plain placeholder substitution for one (already cased/leeted) base
+    Base = base[:1].upper() + base[1:] if base else base
+    BASE = base.upper()
+    camel = WordListMaker._to_camel(base)
+    out = []
+    for num in NUMBERS:
+        for sym in SYMBOLS:
+            for year in YEARS:
+                out.append(
+                    mask.replace("{base}", base)
+                    .replace("{Base}", Base)
+                    .replace("{BASE}", BASE)
+                    .replace("{camel}", camel)
+                    .replace("{num}", num)
+                    .replace("{sym}", sym)
+                    .replace("{year}", year)
+                )
+    return out
+
+
+class MaskGenerationTest(unittest.TestCase):
+    def generate(self, masks):
+        gen = _make_generator(
+            ["original"], [_compile_mask(m) for m in masks], NUMBERS, SYMBOLS, YEARS, {}, 1)
+        return list(gen(BASES))
+
+    def test_each_mask_matches_reference(self):
+        for mask in MASKS:
+            with self.subTest(mask=mask):
+                expected = [c for b in BASES for c in reference(b, mask)]
+                self.assertEqual(self.generate([mask]), expected)
+
+    def test_all_masks_in_one_generator(self):
+        expected = [c for b in BASES for m in MASKS for c in reference(b, m)]
+        self.assertEqual(self.generate(MASKS), expected)
+
+
+if __name__ == "__main__":
+    unittest.main()